@@ -3,10 +3,28 @@
 Simple MCP client without asyncio
 """
 
+import copy
 import json
 import subprocess
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+
+    # orjson reads and writes bytes directly, matching the binary pipes
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    # Reuse one compact encoder and decoder instead of building them per call
+    _json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    _json_decoder = json.JSONDecoder()
+
+    def _json_loads(data: bytes) -> Any:
+        return _json_decoder.decode(data.decode("utf-8"))
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encoder.encode(obj).encode("utf-8")
 
 
 class SimpleMCPClient:
@@ -16,6 +34,10 @@ class SimpleMCPClient:
         self.process: Optional[subprocess.Popen] = None
         self.request_id = 0
         self.initialized = False
+        # Prompt names from the last successful prompts/list
+        self._known_prompts: Optional[Set[str]] = None
+        # Successful prompts/get responses keyed by name and sorted arguments
+        self._prompt_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Dict] = {}
 
     def start_server(self, command: str, args: Optional[List[str]] = None) -> bool:
         """Start MCP server as subprocess"""
@@ -27,9 +49,9 @@ class SimpleMCPClient:
                 [command] + args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=0,
+                # Inherit stderr so server logs reach the caller (and pytest's
+                # capture) without an undrained pipe that could block the server
+                stderr=None,
             )
 
             # Give server time to start
@@ -54,35 +76,70 @@ class SimpleMCPClient:
         self, method: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Send JSON-RPC request to server"""
+        return self._send_requests([(method, params)])[0]
+
+    def _send_requests(
+        self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC requests in one write and collect responses"""
         if not self.process or self.process.poll() is not None:
             raise RuntimeError("Server not running")
 
-        # Create JSON-RPC request
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._get_next_id(),
-            "method": method,
-        }
+        # Create JSON-RPC requests
+        request_ids = []
+        request_lines = []
+        for method, params in requests:
+            request: Dict[str, Any] = {
+                "jsonrpc": "2.0",
+                "id": self._get_next_id(),
+                "method": method,
+            }
+
+            if params:
+                request["params"] = params
 
-        if params:
-            request["params"] = params
+            request_ids.append(request["id"])
+            request_lines.append(_json_dumps(request) + b"\n")
 
-        # Send request
-        request_json = json.dumps(request) + "\n"
+        # Pipeline all requests so the server works through them back to back
         if self.process.stdin is None:
             raise RuntimeError("Server stdin is not available")
-        self.process.stdin.write(request_json)
+        self.process.stdin.write(b"".join(request_lines))
         self.process.stdin.flush()
 
-        # Read response
+        # Read responses, matching them to requests by id
         if self.process.stdout is None:
             raise RuntimeError("Server stdout is not available")
-        response_line = self.process.stdout.readline()
-        if not response_line:
-            raise RuntimeError("No response from server")
-
-        response = json.loads(response_line.strip())
-
+        pending = set(request_ids)
+        responses: Dict[int, Dict[str, Any]] = {}
+        while pending:
+            response_line = self.process.stdout.readline()
+            if not response_line:
+                raise RuntimeError("No response from server")
+
+            # MCP stdio messages are one JSON object per line; skip any other
+            # output the server writes to stdout, such as startup logging
+            if not response_line.startswith(b"{"):
+                continue
+
+            response = _json_loads(response_line)
+
+            # A changed prompt list invalidates known names and cached renders
+            if response.get("method") == "notifications/prompts/list_changed":
+                self._known_prompts = None
+                self._prompt_cache.clear()
+
+            # Skip server notifications and anything not answering our requests
+            response_id = response.get("id")
+            if response_id in pending:
+                pending.discard(response_id)
+                responses[response_id] = response
+
+        return [self._unwrap_response(responses[i]) for i in request_ids]
+
+    @staticmethod
+    def _unwrap_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the result or error from a JSON-RPC response"""
         # Return full response (including errors)
         if "error" in response:
             return {"error": response["error"]}
@@ -113,7 +170,7 @@ class SimpleMCPClient:
                     "jsonrpc": "2.0",
                     "method": "notifications/initialized",
                 }
-                notification_json = json.dumps(notification) + "\n"
+                notification_json = _json_dumps(notification) + b"\n"
                 if self.process is None or self.process.stdin is None:
                     raise RuntimeError("Server stdin is not available")
                 self.process.stdin.write(notification_json)
@@ -208,6 +265,12 @@ class SimpleMCPClient:
                 if isinstance(prompts, list) and all(
                     isinstance(prompt, dict) for prompt in prompts
                 ):
+                    # Remember the names so get_prompt need not list again
+                    known_prompts = {
+                        prompt["name"] for prompt in prompts if "name" in prompt
+                    }
+                    if known_prompts:
+                        self._known_prompts = known_prompts
                     return prompts
             return []
 
@@ -216,24 +279,94 @@ class SimpleMCPClient:
             return []
 
     def get_prompt(
-        self, name: str, arguments: Optional[Dict[str, Any]] = None
+        self, name: str, arguments: Optional[Mapping[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Get a prompt template with optional arguments"""
+        """Get a prompt template with optional arguments, caching successes"""
         if not self.initialized:
             raise RuntimeError("Client not initialized")
 
+        # Unknown names fail locally instead of costing a round trip. A failed
+        # or empty listing is not kept, so the next call lists again.
+        if self._known_prompts is None:
+            self.list_prompts()
+        if self._known_prompts is not None and name not in self._known_prompts:
+            return {"error": {"code": -32602, "message": f"Unknown prompt: {name}"}}
+
+        # Rendering is deterministic, so identical requests reuse the response.
+        # Callers get copies so mutating a result never alters the cache.
+        cache_key = self._prompt_cache_key(name, arguments)
+        if cache_key is not None and cache_key in self._prompt_cache:
+            return copy.deepcopy(self._prompt_cache[cache_key])
+
         params: Dict[str, Any] = {"name": name}
         if arguments:
-            params["arguments"] = arguments
+            # Copy so read-only mappings such as MappingProxyType serialize
+            params["arguments"] = dict(arguments)
 
         try:
-            response = self._send_request("prompts/get", params)
+            response = self._normalize_prompt(self._send_request("prompts/get", params))
+            # Errors are not cached so negative cases still reach the server
+            if "error" not in response and cache_key is not None:
+                self._prompt_cache[cache_key] = response
+                return copy.deepcopy(response)
             return response
 
         except Exception as e:
             print(f"Error getting prompt {name}: {e}")
             return {"error": str(e)}
 
+    @staticmethod
+    def _prompt_cache_key(
+        name: str, arguments: Optional[Mapping[str, Any]]
+    ) -> Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]]:
+        """Build the prompt cache key, or None if the arguments are unhashable"""
+        cache_key = (name, tuple(sorted((arguments or {}).items())))
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    @staticmethod
+    def _normalize_prompt(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten each prompt message's text content block to its text, in place"""
+        for message in response.get("messages", []):
+            content = message.get("content")
+            # FastMCP wraps message text in a content block; image, audio and
+            # resource blocks carry no text and are left unchanged
+            if isinstance(content, dict) and content.get("type") == "text":
+                message["content"] = content.get("text", "")
+        return response
+
+    @staticmethod
+    def extract_text(
+        result: Dict[str, Any], message_index: int = 0
+    ) -> Union[str, Dict[str, Any]]:
+        """Get one prompt message's content: text as a string, other blocks as dicts"""
+        return result["messages"][message_index]["content"]
+
+    def get_prompts_batch(
+        self, requests: List[Tuple[str, Optional[Mapping[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Get several prompts with a single pipelined write, in request order"""
+        if not self.initialized:
+            raise RuntimeError("Client not initialized")
+
+        prompt_requests = []
+        for name, arguments in requests:
+            params: Dict[str, Any] = {"name": name}
+            if arguments:
+                params["arguments"] = dict(arguments)
+            prompt_requests.append(("prompts/get", params))
+
+        try:
+            responses = self._send_requests(prompt_requests)
+            return [self._normalize_prompt(response) for response in responses]
+
+        except Exception as e:
+            print(f"Error getting prompts batch: {e}")
+            return [{"error": str(e)} for _ in requests]
+
     def call_tool(
         self, name: str, arguments: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -253,6 +386,27 @@ class SimpleMCPClient:
             print(f"Error calling tool {name}: {e}")
             return {"error": str(e)}
 
+    def call_tools_batch(
+        self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Call several tools with a single pipelined write, in call order"""
+        if not self.initialized:
+            raise RuntimeError("Client not initialized")
+
+        requests = []
+        for name, arguments in calls:
+            params: Dict[str, Any] = {"name": name}
+            if arguments:
+                params["arguments"] = arguments
+            requests.append(("tools/call", params))
+
+        try:
+            return self._send_requests(requests)
+
+        except Exception as e:
+            print(f"Error calling tools batch: {e}")
+            return [{"error": str(e)} for _ in calls]
+
     def close(self) -> None:
         """Close connection and terminate server"""
         if self.process:
@@ -273,6 +427,8 @@ class SimpleMCPClient:
             finally:
                 self.process = None
                 self.initialized = False
+                self._known_prompts = None
+                self._prompt_cache.clear()
 
 
 def main() -> None:
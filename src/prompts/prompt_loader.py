@@ -3,10 +3,26 @@ JSON-based prompt loader for MCP servers.
 """
 
 import json
+import os
+import re
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from .validator import ContentValidator
+from .validator import ContentValidator, get_default_validator
+
+try:
+    import orjson
+
+    # orjson parses bytes directly; its JSONDecodeError subclasses json's
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+_LEADING_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+
+# O_BINARY only exists on Windows and O_NOATIME only on Linux
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
 
 
 class JSONPromptLoader:
@@ -73,6 +89,11 @@ class JSONPromptLoader:
             # Get argument definitions
             arg_definitions = prompt_def.get("arguments", [])
 
+            # Optional arguments left unset arrive as None from FastMCP
+            kwargs = {
+                name: value for name, value in kwargs.items() if value is not None
+            }
+
             # Validate and process arguments
             processed_args = self.validator.validate_arguments(arg_definitions, kwargs)
 
@@ -133,6 +154,29 @@ class JSONPromptLoader:
         return self.prompts[prompt_name]
 
 
+def _read_file_bytes(json_path: Path) -> bytes:
+    """
+    Read a whole file without updating its access time where supported.
+
+    Args:
+        json_path: Path to the file
+
+    Returns:
+        Raw file contents
+    """
+    try:
+        fd = os.open(json_path, _READ_FLAGS | _O_NOATIME)
+    except PermissionError:
+        # O_NOATIME is only allowed for the file's owner
+        if not _O_NOATIME:
+            raise
+        fd = os.open(json_path, _READ_FLAGS)
+
+    # Unbuffered reads size the buffer from fstat and read it in one call
+    with open(fd, "rb", buffering=0) as f:
+        return f.read()
+
+
 def load_content_from_json(json_file_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load content from JSON file with validation.
@@ -158,14 +202,19 @@ def load_content_from_json(json_file_path: Optional[str] = None) -> Dict[str, An
     if not json_path.exists():
         raise FileNotFoundError(f"Content file not found: {json_path}")
 
+    raw_content = _read_file_bytes(json_path)
+
+    # Content must be a JSON object, so reject anything else without parsing
+    first_char_index = _LEADING_WHITESPACE.match(raw_content).end()
+    if raw_content[first_char_index : first_char_index + 1] != b"{":
+        raise ValueError(f"Content file must contain a JSON object: {json_path}")
+
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            content = json.load(f)
+        content = _json_loads(raw_content)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in content file: {e}")
 
     # Validate content against schema
-    validator = ContentValidator()
-    validator.validate_content(content)
+    get_default_validator().validate_content(content)
 
     return content
@@ -2,10 +2,11 @@
 Dynamic prompt registration system for MCP servers.
 """
 
-from typing import Any, Dict
+import inspect
+from typing import Any, Dict, Optional
 
 from .prompt_loader import JSONPromptLoader
-from .validator import ContentValidator
+from .validator import get_default_validator
 
 
 class PromptRegistry:
@@ -23,9 +24,8 @@ class PromptRegistry:
             mcp: FastMCP server instance
             content_data: Content configuration dictionary
         """
-        # Create validator and loader
-        validator = ContentValidator()
-        loader = JSONPromptLoader(content_data, validator)
+        # Create loader with the shared default validator
+        loader = JSONPromptLoader(content_data, get_default_validator())
 
         # Load all prompts
         prompts = loader.load_prompts()
@@ -79,6 +79,7 @@ class PromptRegistry:
         arguments = prompt_def.get("arguments", [])
 
         # Create parameter annotations
+        parameters = []
         if arguments:
             annotations = {}
             for arg in arguments:
@@ -95,11 +96,33 @@ class PromptRegistry:
                 else:
                     python_type = str
 
+                # Optional arguments default to their JSON default; those
+                # without one default to None, which the prompt drops as unset
+                if arg.get("required", False):
+                    default = inspect.Parameter.empty
+                else:
+                    default = arg.get("default")
+                    if default is None:
+                        python_type = Optional[python_type]
+
                 annotations[arg_name] = python_type
 
+                parameters.append(
+                    inspect.Parameter(
+                        arg_name,
+                        inspect.Parameter.KEYWORD_ONLY,
+                        default=default,
+                        annotation=python_type,
+                    )
+                )
+
             # Add annotations to function
             func.__annotations__ = annotations
 
+        # FastMCP derives prompt arguments from the signature, which would
+        # otherwise expose the generated function's **kwargs as one argument
+        func.__signature__ = inspect.Signature(parameters)
+
         # Add docstring with argument information
         if arguments:
             docstring_parts = [prompt_def.get("description", "Generated prompt")]
@@ -2,11 +2,14 @@
 Content validation utilities for JSON-based configuration.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 
 class ContentValidator:
@@ -29,11 +32,25 @@ class ContentValidator:
 
         self.schema = self._load_schema()
 
+        # Compile validators once so each validation call skips schema checks
+        validator_class = validator_for(self.schema)
+        validator_class.check_schema(self.schema)
+        self._content_validator = validator_class(self.schema)
+
+        # Prompt schema keeps the shared definitions for reference resolution
+        prompt_schema_def = self.schema.get("definitions", {}).get("prompt", {})
+        self._prompt_validator = (
+            validator_class(
+                {**prompt_schema_def, "definitions": self.schema.get("definitions", {})}
+            )
+            if prompt_schema_def
+            else None
+        )
+
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON schema from file."""
         try:
-            with open(self.schema_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(self.schema_path.read_bytes())
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
         except json.JSONDecodeError as e:
@@ -49,10 +66,9 @@ class ContentValidator:
         Raises:
             ValidationError: If content doesn't match schema
         """
-        try:
-            validate(instance=content, schema=self.schema)
-        except ValidationError as e:
-            raise ValidationError(f"Content validation failed: {e.message}")
+        error = best_match(self._content_validator.iter_errors(content))
+        if error is not None:
+            raise ValidationError(f"Content validation failed: {error.message}")
 
     def validate_prompt(self, prompt_data: Dict[str, Any]) -> None:
         """
@@ -64,21 +80,12 @@ class ContentValidator:
         Raises:
             ValidationError: If prompt doesn't match schema
         """
-        # Extract the prompt definition schema but keep the full schema context
-        prompt_schema_def = self.schema.get("definitions", {}).get("prompt", {})
-        if not prompt_schema_def:
+        if self._prompt_validator is None:
             raise ValueError("Prompt schema definition not found")
 
-        # Create a complete schema with definitions for reference resolution
-        full_prompt_schema = {
-            **prompt_schema_def,
-            "definitions": self.schema.get("definitions", {}),
-        }
-
-        try:
-            validate(instance=prompt_data, schema=full_prompt_schema)
-        except ValidationError as e:
-            raise ValidationError(f"Prompt validation failed: {e.message}")
+        error = best_match(self._prompt_validator.iter_errors(prompt_data))
+        if error is not None:
+            raise ValidationError(f"Prompt validation failed: {error.message}")
 
     def validate_arguments(
         self, prompt_args: list, provided_args: Dict[str, Any]
@@ -130,3 +137,13 @@ class ContentValidator:
                 processed_args[arg_name] = default_value
 
         return processed_args
+
+
+@functools.cache
+def get_default_validator() -> ContentValidator:
+    """
+    Return a shared validator for the default schema.
+
+    The validator holds no per-call state, so one instance serves every caller.
+    """
+    return ContentValidator()
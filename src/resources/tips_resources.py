@@ -1,3 +1,20 @@
+def _format_category_tips(category, tips):
+    """
+    Format one category's tips as a titled, numbered list.
+
+    Args:
+        category: Category name used in the title
+        tips: Tips to list under the title
+
+    Returns:
+        Formatted tips section ending with a newline after the last tip
+    """
+    formatted_tips = f"{category.upper()} Learning Tips:\n\n"
+    for i, tip in enumerate(tips, 1):
+        formatted_tips += f"{i}. {tip}\n"
+    return formatted_tips
+
+
 def register_tips_resources(mcp, tips_by_category):
     """Register tips-related resources with the MCP server."""
 
@@ -22,6 +39,22 @@ def register_tips_resources(mcp, tips_by_category):
 
         return formatted_tips
 
+    @mcp.resource("tips://all")
+    def get_all_tips_resource() -> str:
+        """
+        Get learning tips for every category in a single resource.
+
+        Returns:
+            Formatted learning tips for all categories, one section per category
+        """
+        if not tips_by_category:
+            return "No learning tips available at the moment."
+
+        return "\n".join(
+            _format_category_tips(category, tips)
+            for category, tips in tips_by_category.items()
+        )
+
     # Dynamic resource by category
     @mcp.resource("tips://category/{category}")
     def get_tips_by_category(category: str) -> str:
@@ -46,9 +79,7 @@ def register_tips_resources(mcp, tips_by_category):
         tips = tips_by_category[category_lower]
 
         # Format as a readable string resource
-        formatted_tips = f"{category.upper()} Learning Tips:\n\n"
-        for i, tip in enumerate(tips, 1):
-            formatted_tips += f"{i}. {tip}\n"
+        formatted_tips = _format_category_tips(category, tips)
 
         # Add footer with available categories
         other_categories = [
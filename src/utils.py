@@ -1,14 +1,60 @@
+import copy
+import functools
 import os
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+# Shared read-only result for every fallback path, so failures never allocate
+_EMPTY_TIPS: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
 
 
 def load_content_from_json(json_file_path: Optional[str] = None) -> dict:
     """
     Load complete content configuration from JSON file.
 
+    Parsed content is cached per file and reused until the file's
+    modification time or size changes. Each call returns an independent
+    copy, so callers may mutate it freely.
+
     Args:
         json_file_path: Optional path to JSON file. If None, uses default content.json
 
+    Returns:
+        Dictionary containing full content configuration
+    """
+    resolved_path = os.path.abspath(json_file_path or get_default_content_path())
+    content = _load_content_cached(resolved_path, *_file_signature(resolved_path))
+    return copy.deepcopy(content)
+
+
+def _file_signature(json_file_path: str) -> Tuple[int, int]:
+    """
+    Get the modification time and size used to key the content caches.
+
+    Args:
+        json_file_path: Absolute path to JSON file
+
+    Returns:
+        Tuple of modification time in nanoseconds and size in bytes,
+        or (0, 0) if the file cannot be accessed
+    """
+    try:
+        stat_result = os.stat(json_file_path)
+    except OSError:
+        return 0, 0
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _load_content_cached(json_file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Load and validate a specific version of a content file.
+
+    Args:
+        json_file_path: Absolute path to JSON file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+
     Returns:
         Dictionary containing full content configuration
     """
@@ -18,43 +64,78 @@ def load_content_from_json(json_file_path: Optional[str] = None) -> dict:
     return loader_func(json_file_path)
 
 
-def load_tips_from_json(json_file_path: Optional[str] = None) -> Dict[str, List[str]]:
+def load_tips_from_json(
+    json_file_path: Optional[str] = None,
+) -> Mapping[str, Tuple[str, ...]]:
     """
     Load tips from content configuration.
 
+    Results are cached per file and reused until the file's modification
+    time or size changes. The returned mapping and its tip sequences are
+    always read-only, and missing or invalid content yields a shared empty
+    mapping.
+
     Args:
         json_file_path: Optional path to JSON file. If provided, takes precedence over environment variable.
 
     Returns:
-        Dictionary containing tips by category
+        Mapping of category to a tuple of tips
     """
     # Use provided path or get from environment variable
     if json_file_path is None:
         json_file_path = os.getenv("TIPS_JSON_PATH")
 
+    resolved_path = os.path.abspath(json_file_path or get_default_content_path())
+
+    # Key the cache on the file signature so edits on disk invalidate it
+    return _load_tips_cached(resolved_path, *_file_signature(resolved_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_tips_cached(
+    json_file_path: str, mtime_ns: int, size: int
+) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Load and extract tips for a specific version of a content file.
+
+    Args:
+        json_file_path: Absolute path to JSON file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+
+    Returns:
+        Mapping of category to a tuple of tips
+    """
     try:
-        # Load complete content configuration
-        content = load_content_from_json(json_file_path)
+        # Load complete content configuration, sharing the parsed content cache
+        content = _load_content_cached(json_file_path, mtime_ns, size)
 
         # Extract tips section
-        tips = content.get("tips", {})
+        tips = content.get("tips")
 
         if not tips:
             print(
                 "Warning: No tips found in content configuration. Returning empty tips."
             )
+            return _EMPTY_TIPS
 
-        return tips
+        # The tips are shared between callers, so freeze both levels
+        return MappingProxyType(
+            {category: tuple(category_tips) for category, category_tips in tips.items()}
+        )
 
     except Exception as e:
         print(f"Error loading content for tips: {e}. Returning empty tips.")
-        return {}
+        return _EMPTY_TIPS
 
 
+@functools.cache
 def get_default_content_path() -> str:
     """
     Get the default path to content.json file.
 
+    The path only depends on where this module lives, so it is computed once.
+
     Returns:
         Path to the default content.json file
     """
@@ -0,0 +1,141 @@
+"""Shared pytest fixtures for the MCP test suite."""
+
+import os
+import tempfile
+from typing import Any, Callable, Dict, Generator, List
+
+import orjson
+import pytest
+
+from src.client import SimpleMCPClient
+
+
+def pytest_configure(config):
+    """Keep temporary files on a RAM-backed filesystem when one is available."""
+    # PYTEST_TMPDIR overrides the default /dev/shm (Linux tmpfs)
+    temp_root = os.environ.get("PYTEST_TMPDIR", "/dev/shm")
+    if os.path.isdir(temp_root) and os.access(temp_root, os.W_OK):
+        tempfile.tempdir = temp_root
+
+
+def _start_client(*server_args: str) -> SimpleMCPClient:
+    """Start src/server.py with extra arguments and initialize a client for it."""
+    client = SimpleMCPClient()
+
+    # Start server
+    if not client.start_server("python", ["src/server.py", *server_args]):
+        client.close()
+        pytest.fail("Failed to start MCP server")
+
+    # Initialize client
+    if not client.initialize():
+        client.close()
+        pytest.fail("Failed to initialize MCP client")
+
+    return client
+
+
+@pytest.fixture(scope="session")
+def mcp_client() -> Generator[SimpleMCPClient, None, None]:
+    """
+    Create and initialize a SimpleMCPClient shared by all server tests.
+
+    The tools, resources and prompts under test are read-only, so a single
+    server process is started once per session (once per worker under
+    pytest-xdist).
+
+    Yields:
+        Initialized SimpleMCPClient instance
+    """
+    client = _start_client()
+
+    try:
+        # Render each prompt that needs no arguments once during setup, so the
+        # first prompt test does not pay for listing and first-render costs.
+        # The listing is remembered by the client and reused by get_prompt.
+        for prompt in client.list_prompts():
+            arguments = prompt.get("arguments") or []
+            if not any(argument.get("required") for argument in arguments):
+                client.get_prompt(prompt["name"])
+
+        yield client
+
+    finally:
+        # Always clean up, even if test fails
+        client.close()
+
+
+@pytest.fixture
+def fresh_mcp_client(request) -> Callable[..., SimpleMCPClient]:
+    """
+    Return a factory for clients backed by their own server process.
+
+    Use this instead of mcp_client for tests that need different server
+    arguments or would otherwise change the shared server's state. Each
+    client is closed when the test finishes.
+
+    Returns:
+        Function taking extra server arguments and returning an
+        initialized SimpleMCPClient
+    """
+
+    def _factory(*server_args: str) -> SimpleMCPClient:
+        client = _start_client(*server_args)
+        request.addfinalizer(client.close)
+        return client
+
+    return _factory
+
+
+@pytest.fixture(scope="session")
+def tips_json_fixtures(tmp_path_factory):
+    """
+    Write the JSON content variants used by loader tests once per session.
+
+    Returns:
+        Dictionary mapping variant name ("valid", "invalid", "wrongtype")
+        to the path of the written file
+    """
+    directory = tmp_path_factory.mktemp("tips")
+
+    valid_path = directory / "valid.json"
+    valid_path.write_bytes(
+        orjson.dumps(
+            {
+                "tips": {"fixture": ["Fixture tip 1", "Fixture tip 2"]},
+                "messages": {"greetings": ["Hello {name}!"]},
+                "prompts": {},
+            }
+        )
+    )
+
+    invalid_path = directory / "invalid.json"
+    invalid_path.write_bytes(b'{"invalid": json, "syntax": }')
+
+    # Valid JSON, but tips must be an object of category lists
+    wrongtype_path = directory / "wrongtype.json"
+    wrongtype_path.write_bytes(orjson.dumps({"tips": ["not", "a", "mapping"]}))
+
+    return {
+        "valid": valid_path,
+        "invalid": invalid_path,
+        "wrongtype": wrongtype_path,
+    }
+
+
+@pytest.fixture(scope="session")
+def tool_list(mcp_client: SimpleMCPClient) -> List[Dict[str, Any]]:
+    """List the server's tools once per session."""
+    return mcp_client.list_tools()
+
+
+@pytest.fixture(scope="session")
+def resource_list(mcp_client: SimpleMCPClient) -> List[Dict[str, Any]]:
+    """List the server's resources once per session."""
+    return mcp_client.list_resources()
+
+
+@pytest.fixture(scope="session")
+def prompt_list(mcp_client: SimpleMCPClient) -> List[Dict[str, Any]]:
+    """List the server's prompts once per session."""
+    return mcp_client.list_prompts()
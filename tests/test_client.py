@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test MCP client helpers that do not need a running server
+"""
+
+import io
+
+import pytest
+
+from src.client import SimpleMCPClient
+
+
+def test_normalize_prompt_keeps_non_text_blocks() -> None:
+    """Test that only text content blocks are flattened to strings"""
+    image = {"type": "image", "data": "aGk=", "mimeType": "image/png"}
+    response = {
+        "messages": [
+            {"role": "user", "content": {"type": "text", "text": "Describe this"}},
+            {"role": "user", "content": dict(image)},
+        ]
+    }
+
+    normalized = SimpleMCPClient._normalize_prompt(response)
+    text_message, image_message = normalized["messages"]
+
+    assert text_message["content"] == "Describe this"
+    assert image_message["content"] == image
+    assert SimpleMCPClient.extract_text(normalized) == "Describe this"
+    assert SimpleMCPClient.extract_text(normalized, 1) == image
+
+
+class _ScriptedProcess:
+    """Stand-in server process that replays fixed stdout lines"""
+
+    def __init__(self, stdout: bytes) -> None:
+        self.stdin = io.BytesIO()
+        self.stdout = io.BytesIO(stdout)
+
+    def poll(self) -> None:
+        return None
+
+
+def test_prompt_list_changed_clears_prompt_caches() -> None:
+    """Test that a list_changed notification drops known and cached prompts"""
+    client = SimpleMCPClient()
+    client._known_prompts = {"stale_prompt"}
+    client._prompt_cache[("stale_prompt", ())] = {"messages": []}
+    client.process = _ScriptedProcess(
+        b'{"jsonrpc":"2.0","method":"notifications/prompts/list_changed"}\n'
+        b'{"jsonrpc":"2.0","id":1,"result":{}}\n'
+    )
+
+    assert client._send_request("ping") == {}
+    assert client._known_prompts is None
+    assert not client._prompt_cache
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,8 +5,6 @@ This module tests the consolidated prompt registration system that
 replaces the previous category-specific prompt files.
 """
 
-import os
-import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -17,9 +15,6 @@ from prompts.prompts import (
     validate_prompt_structure,
 )
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
 class TestConsolidatedPrompts(unittest.TestCase):
     """Test consolidated prompt registration functionality."""
@@ -1,8 +1,7 @@
 """Tests for ContentManager class."""
 
-import json
-import os
-import tempfile
+import orjson
+import pytest
 
 from src.content.content_manager import ContentManager
 
@@ -217,7 +216,8 @@ class TestContentManager:
 class TestContentManagerDynamic:
     """Dynamic JSON testing for ContentManager."""
 
-    def test_dynamic_json_loading(self):
+    @pytest.mark.filesystem
+    def test_dynamic_json_loading(self, tmp_path):
         """Test ContentManager with dynamically created JSON."""
         temp_content = {
             "tips": {
@@ -241,39 +241,32 @@ class TestContentManagerDynamic:
         }
 
         # Test with temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(temp_content, f)
-            temp_file = f.name
-
-        try:
-            # Load and test content
-            with open(temp_file, "r") as f:
-                loaded_content = json.load(f)
-
-            manager = ContentManager(loaded_content)
-
-            # Test custom tips
-            custom_tips = manager.get_tips("custom")
-            assert len(custom_tips) == 2
-            assert "Custom tip 1" in custom_tips
-
-            # Test custom greetings
-            greetings = manager.get_greetings()
-            assert len(greetings) == 1
-            assert "{name}" in greetings[0]
-
-            # Test custom prompts
-            custom_prompts = manager.get_prompts("custom_category")
-            assert "test_prompt" in custom_prompts
-
-            # Test categories
-            tip_categories = manager.get_tip_categories()
-            assert "custom" in tip_categories
-            assert "testing" in tip_categories
-
-        finally:
-            # Clean up
-            os.unlink(temp_file)
+        temp_file = tmp_path / "content.json"
+        temp_file.write_bytes(orjson.dumps(temp_content))
+
+        # Load and test content
+        loaded_content = orjson.loads(temp_file.read_bytes())
+
+        manager = ContentManager(loaded_content)
+
+        # Test custom tips
+        custom_tips = manager.get_tips("custom")
+        assert len(custom_tips) == 2
+        assert "Custom tip 1" in custom_tips
+
+        # Test custom greetings
+        greetings = manager.get_greetings()
+        assert len(greetings) == 1
+        assert "{name}" in greetings[0]
+
+        # Test custom prompts
+        custom_prompts = manager.get_prompts("custom_category")
+        assert "test_prompt" in custom_prompts
+
+        # Test categories
+        tip_categories = manager.get_tip_categories()
+        assert "custom" in tip_categories
+        assert "testing" in tip_categories
 
     def test_edge_cases(self):
         """Test ContentManager with edge case content."""
@@ -5,42 +5,42 @@ This module tests the system's ability to handle dynamic JSON configurations
 and edge cases in content loading and validation.
 """
 
-import json
+import itertools
 import os
-import sys
 import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
 
 from content.content_manager import ContentManager
 from prompts.prompts import get_prompt_categories, validate_prompt_structure
 from utils import load_content_from_json
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
+@pytest.mark.filesystem
 class TestDynamicConfigurations(unittest.TestCase):
     """Test dynamic configuration loading and validation."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_files = []
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        for temp_file in self.temp_files:
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
+        """Write each test's content files into its own temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.tmp_path = Path(temp_dir.name)
+        self._file_ids = itertools.count()
+
+    def create_temp_file(self, data):
+        """Create a content file with raw bytes under the test's directory."""
+        temp_file = self.tmp_path / f"content_{next(self._file_ids)}.json"
+        temp_file.write_bytes(data)
+        return str(temp_file)
 
     def create_temp_json_file(self, content_data):
-        """Create a temporary JSON file and track it for cleanup."""
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(content_data, temp_file, indent=2)
-        temp_file.close()
-        self.temp_files.append(temp_file.name)
-        return temp_file.name
+        """Create a content file holding the given data as JSON."""
+        return self.create_temp_file(orjson.dumps(content_data))
 
     def test_minimal_configuration(self):
         """Test system with minimal JSON configuration."""
@@ -195,14 +195,42 @@ class TestDynamicConfigurations(unittest.TestCase):
     def test_invalid_json_handling(self):
         """Test handling of invalid JSON configurations."""
         # Create file with invalid JSON
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        temp_file.write('{"invalid": json, "syntax": }')
-        temp_file.close()
-        self.temp_files.append(temp_file.name)
+        temp_file = self.create_temp_file(b'{"invalid": json, "syntax": }')
 
         # Should raise an exception or return None
         with self.assertRaises(ValueError):
-            load_content_from_json(temp_file.name)
+            load_content_from_json(temp_file)
+
+    def test_empty_file_handling(self):
+        """Test that a zero-byte file is rejected as invalid content."""
+        temp_file = self.create_temp_file(b"")
+
+        with self.assertRaises(ValueError):
+            load_content_from_json(temp_file)
+
+    def test_non_object_json_handling(self):
+        """Test that valid JSON which is not an object is rejected."""
+        temp_file = self.create_temp_json_file(["not", "an", "object"])
+
+        with self.assertRaises(ValueError):
+            load_content_from_json(temp_file)
+
+    @unittest.skipUnless(hasattr(os, "O_NOATIME"), "O_NOATIME is Linux-only")
+    def test_noatime_permission_fallback(self):
+        """Test that files opened without O_NOATIME permission are still read."""
+        temp_file = self.create_temp_json_file({"tips": {"fallback": ["Tip"]}})
+        real_open = os.open
+
+        def open_without_noatime(path, flags, *args):
+            # O_NOATIME fails with EPERM when the process does not own the file
+            if flags & os.O_NOATIME:
+                raise PermissionError("Operation not permitted")
+            return real_open(path, flags, *args)
+
+        with patch("os.open", side_effect=open_without_noatime):
+            loaded_content = load_content_from_json(temp_file)
+
+        self.assertEqual(loaded_content["tips"], {"fallback": ["Tip"]})
 
     def test_missing_file_handling(self):
         """Test handling of missing configuration files."""
@@ -228,8 +256,6 @@ class TestDynamicConfigurations(unittest.TestCase):
 
     def test_large_configuration_performance(self):
         """Test performance with large configuration files."""
-        import time
-
         # Create large configuration
         large_config = {
             "tips": {},
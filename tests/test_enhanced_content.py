@@ -1,28 +1,24 @@
 """Tests for enhanced content.json with messages section."""
 
 import json
-import os
+from pathlib import Path
 
 from jsonschema import validate
 
 from src.content.content_manager import ContentManager
 
+_DATA_DIR = Path(__file__).resolve().parent.parent / "src" / "data"
+
 
 def load_schema():
     """Load the content schema from file."""
-    schema_path = os.path.join(
-        os.path.dirname(__file__), "..", "src", "data", "content_schema.json"
-    )
-    with open(schema_path, "r") as f:
+    with open(_DATA_DIR / "content_schema.json", "r") as f:
         return json.load(f)
 
 
 def load_content():
     """Load the enhanced content.json file."""
-    content_path = os.path.join(
-        os.path.dirname(__file__), "..", "src", "data", "content.json"
-    )
-    with open(content_path, "r") as f:
+    with open(_DATA_DIR / "content.json", "r") as f:
         return json.load(f)
 
 
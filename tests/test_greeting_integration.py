@@ -1,8 +1,7 @@
 """Integration tests for externalized greeting tools."""
 
-import json
-import os
-import tempfile
+import orjson
+import pytest
 
 from src.content.content_manager import ContentManager
 from src.tools.greeting_tools import register_greeting_tools
@@ -129,7 +128,8 @@ class TestGreetingIntegration:
         }
         assert unique_greetings.issubset(expected_greetings)
 
-    def test_dynamic_content_loading(self):
+    @pytest.mark.filesystem
+    def test_dynamic_content_loading(self, tmp_path):
         """Test greeting integration with dynamically loaded content."""
         # Create dynamic content
         dynamic_content = {
@@ -144,32 +144,25 @@ class TestGreetingIntegration:
         }
 
         # Test with temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(dynamic_content, f)
-            temp_file = f.name
-
-        try:
-            # Load content from file
-            with open(temp_file, "r") as f:
-                loaded_content = json.load(f)
-
-            # Test integration
-            content_manager = ContentManager(loaded_content)
-            mock_mcp = MockMCP()
-            register_greeting_tools(mock_mcp, content_manager)
-
-            greeting_func = mock_mcp.tools["generate_greeting"]
-            greeting = greeting_func("DynamicUser")
-
-            assert "DynamicUser" in greeting
-            assert any(
-                template.format(name="DynamicUser") == greeting
-                for template in dynamic_content["messages"]["greetings"]
-            )
-
-        finally:
-            # Clean up
-            os.unlink(temp_file)
+        temp_file = tmp_path / "content.json"
+        temp_file.write_bytes(orjson.dumps(dynamic_content))
+
+        # Load content from file
+        loaded_content = orjson.loads(temp_file.read_bytes())
+
+        # Test integration
+        content_manager = ContentManager(loaded_content)
+        mock_mcp = MockMCP()
+        register_greeting_tools(mock_mcp, content_manager)
+
+        greeting_func = mock_mcp.tools["generate_greeting"]
+        greeting = greeting_func("DynamicUser")
+
+        assert "DynamicUser" in greeting
+        assert any(
+            template.format(name="DynamicUser") == greeting
+            for template in dynamic_content["messages"]["greetings"]
+        )
 
     def test_greeting_tool_empty_greetings_list(self):
         """Test greeting tool behavior with empty greetings list."""
@@ -5,30 +5,30 @@ This module tests the complete end-to-end functionality of the
 content externalization system with custom JSON configurations.
 """
 
-import json
 import os
-import sys
 import tempfile
+import time
 import unittest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import orjson
+import pytest
 
 from content.content_manager import ContentManager
 from server import register_all_components
 from utils import load_content_from_json
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
+@pytest.mark.filesystem
 class TestCompleteIntegration(unittest.TestCase):
     """Test complete system integration with externalized content."""
 
-    def setUp(self):
-        """Set up test fixtures with complete content configuration."""
-        self.mock_mcp = MagicMock()
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared fixtures with complete content configuration."""
         # Complete content configuration for testing
-        self.complete_content = {
+        cls.complete_content = {
             "tips": {
                 "mcp": [
                     "Configure this server by adding it to your MCP client configuration file",
@@ -164,36 +164,35 @@ class TestCompleteIntegration(unittest.TestCase):
             },
         }
 
-    def create_temp_content_file(self, content_data):
+        # Written once and shared by every test in the class
+        cls.temp_file_name = cls.create_temp_content_file(cls.complete_content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary content file."""
+        os.unlink(cls.temp_file_name)
+
+    @staticmethod
+    def create_temp_content_file(content_data):
         """Create a temporary JSON file with content data."""
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(content_data, temp_file, indent=2)
-        temp_file.close()
-        return temp_file.name
+        fd, temp_file_name = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        Path(temp_file_name).write_bytes(orjson.dumps(content_data))
+        return temp_file_name
 
     def test_complete_content_loading(self):
         """Test loading complete content configuration from JSON."""
-        temp_file = self.create_temp_content_file(self.complete_content)
-
-        try:
-            loaded_content = load_content_from_json(temp_file)
+        loaded_content = load_content_from_json(self.temp_file_name)
 
-            # Verify all sections are loaded
-            self.assertIn("tips", loaded_content)
-            self.assertIn("messages", loaded_content)
-            self.assertIn("prompts", loaded_content)
+        # Verify all sections are loaded
+        self.assertIn("tips", loaded_content)
+        self.assertIn("messages", loaded_content)
+        self.assertIn("prompts", loaded_content)
 
-            # Verify content integrity
-            self.assertEqual(loaded_content["tips"], self.complete_content["tips"])
-            self.assertEqual(
-                loaded_content["messages"], self.complete_content["messages"]
-            )
-            self.assertEqual(
-                loaded_content["prompts"], self.complete_content["prompts"]
-            )
-
-        finally:
-            os.unlink(temp_file)
+        # Verify content integrity
+        self.assertEqual(loaded_content["tips"], self.complete_content["tips"])
+        self.assertEqual(loaded_content["messages"], self.complete_content["messages"])
+        self.assertEqual(loaded_content["prompts"], self.complete_content["prompts"])
 
     def test_content_manager_integration(self):
         """Test ContentManager with complete content data."""
@@ -215,36 +214,32 @@ class TestCompleteIntegration(unittest.TestCase):
         default_tips = content_manager.get_tips()
         self.assertEqual(default_tips, mcp_tips)
 
-    @patch("server.register_time_tools")
-    @patch("server.register_greeting_tools")
-    @patch("server.register_tips_tools")
-    @patch("server.register_tips_resources")
-    @patch("server.PromptRegistry")
-    def test_complete_server_registration(
-        self,
-        mock_prompt_registry,
-        mock_tips_resources,
-        mock_tips_tools,
-        mock_greeting_tools,
-        mock_time_tools,
-    ):
+    @patch.multiple(
+        "server",
+        register_time_tools=DEFAULT,
+        register_greeting_tools=DEFAULT,
+        register_tips_tools=DEFAULT,
+        register_tips_resources=DEFAULT,
+        PromptRegistry=DEFAULT,
+    )
+    def test_complete_server_registration(self, **mocks):
         """Test complete server component registration."""
         mock_registry_instance = MagicMock()
-        mock_prompt_registry.return_value = mock_registry_instance
+        mocks["PromptRegistry"].return_value = mock_registry_instance
 
         # Register all components
         register_all_components(self.complete_content)
 
         # Verify all tools were registered
-        mock_time_tools.assert_called_once()
-        mock_greeting_tools.assert_called_once()
-        mock_tips_tools.assert_called_once()
+        mocks["register_time_tools"].assert_called_once()
+        mocks["register_greeting_tools"].assert_called_once()
+        mocks["register_tips_tools"].assert_called_once()
 
         # Verify resources were registered
-        mock_tips_resources.assert_called_once()
+        mocks["register_tips_resources"].assert_called_once()
 
         # Verify prompts were registered
-        mock_prompt_registry.assert_called_once()
+        mocks["PromptRegistry"].assert_called_once()
         mock_registry_instance.register_prompts_from_json.assert_called_once()
 
     def test_dynamic_content_modification(self):
@@ -328,8 +323,6 @@ class TestCompleteIntegration(unittest.TestCase):
             ]
 
         # Test ContentManager performance
-        import time
-
         start_time = time.time()
 
         content_manager = ContentManager(large_content)
@@ -1,7 +1,12 @@
 """Tests for prompt loader simplification."""
 
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
 from src.prompts.prompt_loader import JSONPromptLoader
-from src.prompts.validator import ContentValidator
+from src.prompts.prompt_registry import PromptRegistry
+from src.prompts.validator import ContentValidator, get_default_validator
 
 
 class TestPromptSimplification:
@@ -279,3 +284,70 @@ class TestPromptSimplification:
         result = prompt_func()
         assert result[0]["role"] == "assistant"
         assert result[0]["content"] == "Test template"
+
+    def test_registered_prompt_omits_optional_argument_without_default(self):
+        """Test that an omitted optional argument without a default renders."""
+        content_data = {
+            "prompts": {
+                "test": {
+                    "greeting_prompt": {
+                        "name": "greeting_prompt",
+                        "description": "Prompt with an optional argument",
+                        "template": "Hello {name}!",
+                        "arguments": [
+                            {
+                                "name": "name",
+                                "description": "User name",
+                                "required": True,
+                                "type": "string",
+                            },
+                            {
+                                "name": "title",
+                                "description": "Optional title without a default",
+                                "required": False,
+                                "type": "string",
+                            },
+                        ],
+                        "role": "user",
+                    }
+                }
+            }
+        }
+
+        mcp = FastMCP("test")
+        PromptRegistry().register_prompts_from_json(mcp, content_data)
+
+        messages = asyncio.run(mcp.get_prompt("greeting_prompt", {"name": "Ada"}))
+
+        assert messages.messages[0].content.text == "Hello Ada!"
+
+    def test_registered_prompt_without_arguments_renders(self):
+        """Test that a prompt without arguments renders without any input."""
+        content_data = {
+            "prompts": {
+                "test": {
+                    "static_prompt": {
+                        "name": "static_prompt",
+                        "description": "Prompt without arguments",
+                        "template": "Hello world!",
+                        "role": "user",
+                    }
+                }
+            }
+        }
+
+        mcp = FastMCP("test")
+        PromptRegistry().register_prompts_from_json(mcp, content_data)
+
+        (prompt,) = asyncio.run(mcp.list_prompts())
+        messages = asyncio.run(mcp.get_prompt("static_prompt"))
+
+        assert not prompt.arguments
+        assert messages.messages[0].content.text == "Hello world!"
+
+    def test_default_validator_is_shared(self):
+        """Test that the default validator is built once and reused."""
+        validator = get_default_validator()
+
+        assert isinstance(validator, ContentValidator)
+        assert get_default_validator() is validator
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test MCP prompts functionality
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from src.client import SimpleMCPClient
+
+# Every test here talks to a live MCP server subprocess
+pytestmark = pytest.mark.slow
+
+_CODE_REVIEW_PROMPT = "code_review_prompt"
+_MCP_DEV_PROMPT = "mcp_development_prompt"
+_LEARNING_PLAN_PROMPT = "learning_plan_prompt"
+_DEBUGGING_PROMPT = "debugging_assistant_prompt"
+_PROJECT_PLANNING_PROMPT = "project_planning_prompt"
+
+_EXPECTED_PROMPTS = (
+    _CODE_REVIEW_PROMPT,
+    _MCP_DEV_PROMPT,
+    _LEARNING_PLAN_PROMPT,
+    _DEBUGGING_PROMPT,
+    _PROJECT_PLANNING_PROMPT,
+)
+
+# Read-only argument sets shared by several requests
+_ADVANCED_RESOURCE_ARGS = MappingProxyType(
+    {"component_type": "resource", "complexity": "advanced"}
+)
+_CODE_REVIEW_VALID_ARGS = MappingProxyType(
+    {"language": "python", "code_type": "function"}
+)
+_LEARNING_PLAN_VALID_ARGS = MappingProxyType({"topic": "FastAPI"})
+
+# Prompt name, arguments, and substrings expected in and absent from the text
+PROMPT_CASES = [
+    (_CODE_REVIEW_PROMPT, {}, ["python", "function", "review"], []),
+    (_CODE_REVIEW_PROMPT, _CODE_REVIEW_VALID_ARGS, ["python", "function"], []),
+    (
+        _CODE_REVIEW_PROMPT,
+        {"language": "javascript", "code_type": "class"},
+        ["javascript", "class"],
+        ["python"],
+    ),
+    (
+        _MCP_DEV_PROMPT,
+        {},
+        ["tool", "intermediate", "@mcp.tool()"],
+        ["@mcp.resource()"],
+    ),
+    (
+        _MCP_DEV_PROMPT,
+        _ADVANCED_RESOURCE_ARGS,
+        ["resource", "advanced", "@mcp.resource()"],
+        ["@mcp.tool()", "intermediate"],
+    ),
+    (
+        _LEARNING_PLAN_PROMPT,
+        _LEARNING_PLAN_VALID_ARGS,
+        ["FastAPI", "beginner", "1 month"],
+        [],
+    ),
+    (
+        _LEARNING_PLAN_PROMPT,
+        {"topic": "Rust", "skill_level": "advanced", "timeframe": "6 months"},
+        ["Rust", "advanced", "6 months"],
+        ["beginner"],
+    ),
+    # skill_level is optional and omitted while timeframe is given
+    (
+        _LEARNING_PLAN_PROMPT,
+        {"topic": "Go", "timeframe": "2 weeks"},
+        ["Go", "beginner", "2 weeks"],
+        ["1 month"],
+    ),
+    (_DEBUGGING_PROMPT, {}, ["python", "runtime"], []),
+    (
+        _PROJECT_PLANNING_PROMPT,
+        {"project_type": "web app"},
+        ["web app", "1-3", "1-3 months"],
+        [],
+    ),
+]
+
+
+def _assert_prompt_ok(result: Dict[str, Any]) -> None:
+    """Assert that a prompt rendered without error and returned messages"""
+    assert "error" not in result
+    assert result.get("messages")
+
+
+def _assert_content(text: str, expected: List[str], absent: List[str]) -> None:
+    """Assert expected and absent substrings at once, reporting every mismatch"""
+    problems = [f"missing {needle!r}" for needle in expected if needle not in text]
+    problems += [f"unexpected {needle!r}" for needle in absent if needle in text]
+    assert not problems, f"{problems} in text: {text[:100]}..."
+
+
+def test_list_prompts(prompt_list: List[Dict[str, Any]]) -> None:
+    """Test that we can list available prompts and find expected prompts"""
+    prompts = prompt_list
+
+    # Verify prompts list structure
+    assert prompts, "Expected non-empty prompts list"
+
+    # Get prompt names
+    prompt_names = [prompt.get("name") for prompt in prompts]
+
+    # Verify expected prompts exist
+    for expected_prompt in _EXPECTED_PROMPTS:
+        assert (
+            expected_prompt in prompt_names
+        ), f"Expected prompt '{expected_prompt}' not found in: {prompt_names}"
+
+
+@pytest.mark.parametrize("name, args, expect_substrs, expect_missing", PROMPT_CASES)
+def test_get_prompt(
+    mcp_client: SimpleMCPClient,
+    name: str,
+    args: Mapping[str, str],
+    expect_substrs: List[str],
+    expect_missing: List[str],
+) -> None:
+    """Test that each prompt renders its arguments or their defaults"""
+    result = mcp_client.get_prompt(name, args)
+
+    _assert_prompt_ok(result)
+    # Each JSON prompt renders to exactly one message
+    (message,) = result["messages"]
+    assert message["role"] == "user"
+
+    text = mcp_client.extract_text(result)
+    _assert_content(text, expect_substrs, expect_missing)
+
+
+def test_get_prompt_reuses_cached_response(mcp_client: SimpleMCPClient) -> None:
+    """Test that cached prompt responses are returned as independent copies"""
+    first = mcp_client.get_prompt(_CODE_REVIEW_PROMPT, _CODE_REVIEW_VALID_ARGS)
+    _assert_prompt_ok(first)
+    expected = first["messages"][0]["content"]
+
+    # Mutating one result must not leak into later cached results
+    first["messages"][0]["content"] = "mutated"
+    second = mcp_client.get_prompt(_CODE_REVIEW_PROMPT, _CODE_REVIEW_VALID_ARGS)
+
+    assert second is not first
+    assert second["messages"][0]["content"] == expected
+
+
+def test_get_prompt_unhashable_argument(mcp_client: SimpleMCPClient) -> None:
+    """Test that an unhashable argument value yields an error, not an exception"""
+    result = mcp_client.get_prompt(_CODE_REVIEW_PROMPT, {"language": ["python"]})
+
+    assert "error" in result
+
+
+def test_get_nonexistent_prompt(mcp_client: SimpleMCPClient) -> None:
+    """Test that requesting an unknown prompt returns an error"""
+    result = mcp_client.get_prompt("nonexistent_prompt")
+
+    assert "error" in result
+    assert "nonexistent_prompt" in result["error"]["message"]
+
+    # get_prompt rejects unknown names locally; the batch reaches the server
+    (server_result,) = mcp_client.get_prompts_batch([("nonexistent_prompt", None)])
+
+    assert "error" in server_result
+    assert "nonexistent_prompt" in server_result["error"]["message"]
+
+
+def test_prompt_argument_validation(mcp_client: SimpleMCPClient) -> None:
+    """Test required, valid and unexpected prompt arguments in one batch"""
+    missing, valid, unexpected = mcp_client.get_prompts_batch(
+        [
+            (_LEARNING_PLAN_PROMPT, None),
+            (_LEARNING_PLAN_PROMPT, _LEARNING_PLAN_VALID_ARGS),
+            (_CODE_REVIEW_PROMPT, {"unexpected": "value"}),
+        ]
+    )
+
+    # Omitting a required argument is reported as an error
+    assert "error" in missing
+    assert "topic" in missing["error"]["message"]
+
+    _assert_prompt_ok(valid)
+
+    # Arguments the prompt does not declare are rejected
+    assert "error" in unexpected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
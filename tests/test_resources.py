@@ -3,13 +3,16 @@
 Test MCP resources functionality
 """
 
-from typing import Generator
+from typing import Any, Callable, Dict, List
 
 import pytest
 
 from src.client import SimpleMCPClient
 from src.resources.tips_resources import register_tips_resources
 
+# Tip categories served by the default content configuration
+_CATEGORIES = ("mcp", "python", "docker")
+
 
 # Mock MCP object for testing resource registration
 class MockMCP:
@@ -31,6 +34,8 @@ class MockMCP:
             # Simple way to identify the function for this specific task
             if "tips://category/" in uri:
                 self.decorated_functions['get_tips_by_category'] = func
+            elif uri == "tips://all":
+                self.decorated_functions['get_all_tips'] = func
             # Add more conditions if other functions were to be tested this way
             # Optionally, we could attach the uri to the function for inspection
             # setattr(func, '_mcp_uri', uri)
@@ -59,6 +64,10 @@ MOCK_TIPS_DATA = {
 
 # Test suite for tips_resources.py using direct function calls via mock
 class TestTipsResources:
+    # Expected values are derived once from MOCK_TIPS_DATA rather than per test
+    _EXPECTED_TITLES = {cat: f"{cat.upper()} Learning Tips:\n\n" for cat in MOCK_TIPS_DATA}
+    _OTHER_CATS = {cat: frozenset(MOCK_TIPS_DATA) - {cat} for cat in MOCK_TIPS_DATA}
+
     def setup_method(self, method):
         """
         Set up each test method.
@@ -97,16 +106,13 @@ class TestTipsResources:
         ]
 
         expected_tips = MOCK_TIPS_DATA[category_to_test]
-        all_categories = sorted(MOCK_TIPS_DATA.keys()) # For predictable order in footer check
-        
-        other_categories = [cat for cat in all_categories if cat != category_to_test]
-
+        expected_title = self._EXPECTED_TITLES[category_to_test]
+        other_categories = self._OTHER_CATS[category_to_test]
 
         for category_input in category_casings:
             result_string = self.get_tips_by_category_func(category_input)
 
             # 1. Assert title
-            expected_title = f"{category_to_test.upper()} Learning Tips:\n\n"
             assert result_string.startswith(expected_title), \
                 f"Failed for input '{category_input}'. Expected title: '{expected_title}'"
 
@@ -133,6 +139,24 @@ class TestTipsResources:
             assert category_to_test not in footer_content, \
                 f"Failed for input '{category_input}'. Current category '{category_to_test}' found in footer."
 
+    def test_get_all_tips(self):
+        """
+        Test that the combined resource lists every category and its tips
+        in a single response.
+        """
+        get_all_tips_func = self.mock_mcp.decorated_functions.get('get_all_tips')
+        assert get_all_tips_func is not None, \
+            "Failed to retrieve get_all_tips function via mock MCP"
+
+        result_string = get_all_tips_func()
+
+        for category, tips in MOCK_TIPS_DATA.items():
+            assert f"{category.upper()} Learning Tips:\n\n" in result_string, \
+                f"Missing section title for category '{category}'"
+            for i, tip in enumerate(tips):
+                assert f"{i + 1}. {tip}" in result_string, \
+                    f"Missing tip '{tip}' for category '{category}'"
+
     def test_get_tips_by_category_non_existing_category(self):
         """
         Test retrieving tips for a non-existing category.
@@ -169,19 +193,13 @@ class TestTipsResources:
         result_string = self.get_tips_by_category_func(category_with_empty_tips)
 
         # 1. Assert title
-        expected_title = f"{category_with_empty_tips.upper()} Learning Tips:\n\n"
+        expected_title = self._EXPECTED_TITLES[category_with_empty_tips]
         assert result_string.startswith(expected_title), \
             f"Expected title: '{expected_title}' not found or incorrect."
 
         # 2. Assert structure for empty tips (title followed by double newline then footer)
-        all_categories = sorted(MOCK_TIPS_DATA.keys())
-        other_categories_list = [cat for cat in all_categories if cat != category_with_empty_tips]
-        
-        # The function joins with ", " - let's replicate that for the expected string
-        other_categories_str = ", ".join(other_categories_list)
-        
-        expected_structure_after_title = f"\n\nOther available categories: {other_categories_str}"
-        
+        other_categories_list = self._OTHER_CATS[category_with_empty_tips]
+
         # Check that the part of the string immediately after the title contains the footer intro
         content_after_title = result_string[len(expected_title):]
         
@@ -209,58 +227,23 @@ class TestTipsResources:
         assert "2." not in content_before_footer, "Found '2.' indicating a tip, which should not be present for empty list."
 
 
-@pytest.fixture
-def mcp_client() -> Generator[SimpleMCPClient, None, None]:
-    """
-    Create and initialize SimpleMCPClient for testing.
-
-    Yields:
-        Initialized SimpleMCPClient instance    Handles:
-        - Server startup
-        - Client initialization
-        - Cleanup on test completion
-    """
-    client = SimpleMCPClient()
-
-    try:
-        # Start server
-        server_started = client.start_server(
-            "python", ["src/server.py", "-j", "src/data/content.json"]
-        )
-        assert server_started, "Failed to start MCP server"
-
-        # Initialize client
-        initialized = client.initialize()
-        assert initialized, "Failed to initialize MCP client"
-
-        yield client
-
-    finally:
-        # Always clean up, even if test fails
-        client.close()
-
-
-def test_list_resources(mcp_client: SimpleMCPClient) -> None:
+@pytest.mark.slow
+def test_list_resources(resource_list: List[Dict[str, Any]]) -> None:
     """Test that we can list available resources"""
-    # Get list of available resources
-    resources = mcp_client.list_resources()
+    resources = resource_list
 
     # Verify resources list structure
     assert resources, "Expected non-empty resources list"
-    assert (
-        len(resources) >= 1
-    ), f"Expected at least 1 resource, found {len(resources)} resources"
 
     # Get resource URIs
     resource_uris = [resource.get("uri") for resource in resources]
 
     # Should contain tips resources
     tips_resources = [uri for uri in resource_uris if uri and "tips://" in uri]
-    assert (
-        len(tips_resources) > 0
-    ), f"Expected tips:// resources, found URIs: {resource_uris}"
+    assert tips_resources, f"Expected tips:// resources, found URIs: {resource_uris}"
 
 
+@pytest.mark.slow
 def test_read_resource_mcp_tips(mcp_client: SimpleMCPClient) -> None:
     """Test reading the MCP tips resource"""
     # Read the MCP tips resource
@@ -277,86 +260,95 @@ def test_read_resource_mcp_tips(mcp_client: SimpleMCPClient) -> None:
     # Verify response structure
     assert "contents" in result, f"Expected 'contents' in result, got: {result}"
     assert result["contents"], f"Expected non-empty contents, got: {result['contents']}"
-    assert (
-        len(result["contents"]) > 0
-    ), f"Expected contents array with items, got: {result['contents']}"
 
     # Extract content
     content = result["contents"][0]["text"]
+    content_lower = content.lower()
     # Should contain MCP-related content
     assert (
-        "MCP" in content or "mcp-test" in content.lower()
+        "MCP" in content or "mcp-test" in content_lower
     ), f"Expected MCP content in resource, got: {content[:100]}..."
     assert (
-        "tips" in content.lower()
+        "tips" in content_lower
     ), f"Expected tips content in resource, got: {content[:100]}..."
 
 
-def test_read_resource_category_tips(mcp_client: SimpleMCPClient) -> None:
+@pytest.mark.slow
+@pytest.mark.parametrize("category", _CATEGORIES)
+def test_read_resource_category_tips(mcp_client: SimpleMCPClient, category: str) -> None:
     """Test reading category-specific tips resources"""
-    categories = ["mcp"]
+    uri = f"tips://category/{category}"
 
-    for category in categories:
-        uri = f"tips://category/{category}"
+    # Read the category tips resource
+    result = mcp_client.read_resource(uri)
 
-        # Read the category tips resource
-        result = mcp_client.read_resource(uri)
+    # Check for errors
+    assert (
+        "error" not in result
+    ), f"Resource read failed for '{uri}' with JSON-RPC error: {result.get('error')}"
+    assert not result.get(
+        "isError"
+    ), f"Resource read failed for '{uri}' with FastMCP error: {result}"
 
-        # Check for errors
-        assert (
-            "error" not in result
-        ), f"Resource read failed for '{uri}' with JSON-RPC error: {result.get('error')}"
-        assert not result.get(
-            "isError"
-        ), f"Resource read failed for '{uri}' with FastMCP error: {result}"
+    # Verify response structure
+    assert "contents" in result, f"Expected 'contents' in result for '{uri}', got: {result}"
+    assert result[
+        "contents"
+    ], f"Expected non-empty contents for '{uri}', got: {result['contents']}"
 
-        # Verify response structure
-        assert (
-            "contents" in result
-        ), f"Expected 'contents' in result for '{uri}', got: {result}"
-        assert result[
-            "contents"
-        ], f"Expected non-empty contents for '{uri}', got: {result['contents']}"
+    # Extract content
+    content = result["contents"][0]["text"]
+
+    # Should contain category-specific content
+    assert (
+        category.upper() in content
+    ), f"Expected '{category.upper()}' in resource content, got: {content[:100]}..."
 
-        # Extract content
-        content = result["contents"][0]["text"]
 
-        # Should contain category-specific content
+@pytest.mark.slow
+def test_read_resource_all_tips(mcp_client: SimpleMCPClient) -> None:
+    """Test reading tips for all categories with a single resource read"""
+    result = mcp_client.read_resource("tips://all")
+
+    # Check for errors
+    assert (
+        "error" not in result
+    ), f"Resource read failed with JSON-RPC error: {result.get('error')}"
+    assert not result.get(
+        "isError"
+    ), f"Resource read failed with FastMCP error: {result}"
+
+    # Verify response structure
+    assert "contents" in result, f"Expected 'contents' in result, got: {result}"
+    assert result["contents"], f"Expected non-empty contents, got: {result['contents']}"
+
+    # Every category should be present in the one payload
+    content = result["contents"][0]["text"]
+    for category in _CATEGORIES:
         assert (
             category.upper() in content
         ), f"Expected '{category.upper()}' in resource content, got: {content[:100]}..."
 
 
-def test_read_resource_mcp_tips_missing(mcp_client: SimpleMCPClient) -> None:
+@pytest.mark.slow
+def test_read_resource_mcp_tips_missing(
+    fresh_mcp_client: Callable[..., SimpleMCPClient]
+) -> None:
     """Test reading MCP tips when they are missing from the data source."""
-    # This test requires a server instance with specific data.
-    # We'll create a new client and server instance for this test case
-    # to avoid interfering with the shared mcp_client fixture if it uses default data.
-
-    client = SimpleMCPClient()
-    try:
-        # Start server with the JSON file that has no MCP tips
-        server_started = client.start_server(
-            "python", ["src/server.py", "-j", "tests/data/tips_categories_no_mcp.json"]
-        )
-        assert server_started, "Failed to start MCP server for missing tips test"
-
-        initialized = client.initialize()
-        assert initialized, "Failed to initialize MCP client for missing tips test"
-
-        result = client.read_resource("tips://mcp")
-
-        assert "error" not in result, f"Resource read failed with JSON-RPC error: {result.get('error')}"
-        assert not result.get("isError"), f"Resource read failed with FastMCP error: {result}"
-        assert "contents" in result, f"Expected 'contents' in result, got: {result}"
-        assert result["contents"], f"Expected non-empty contents, got: {result['contents']}"
-        
-        content = result["contents"][0]["text"]
-        expected_message = "MCP Tips:\n\nNo MCP tips available at the moment."
-        assert content == expected_message, f"Expected '{expected_message}', got '{content}'"
+    # This test requires a server instance with specific data, so it gets
+    # its own server rather than the shared mcp_client fixture.
+    client = fresh_mcp_client("-j", "tests/data/tips_categories_no_mcp.json")
+
+    result = client.read_resource("tips://mcp")
+
+    assert "error" not in result, f"Resource read failed with JSON-RPC error: {result.get('error')}"
+    assert not result.get("isError"), f"Resource read failed with FastMCP error: {result}"
+    assert "contents" in result, f"Expected 'contents' in result, got: {result}"
+    assert result["contents"], f"Expected non-empty contents, got: {result['contents']}"
 
-    finally:
-        client.close()
+    content = result["contents"][0]["text"]
+    expected_message = "MCP Tips:\n\nNo MCP tips available at the moment."
+    assert content == expected_message, f"Expected '{expected_message}', got '{content}'"
 
 
 if __name__ == "__main__":
@@ -1,26 +1,32 @@
-import json
-import os
+from functools import lru_cache
+from pathlib import Path
 
-import pytest
-from jsonschema import ValidationError, validate
+import orjson
+from jsonschema import Draft7Validator, validate
 
+_DATA_DIR = Path(__file__).resolve().parent.parent / "src" / "data"
 
+
+@lru_cache(maxsize=1)
 def load_schema():
     """Load the content schema from file."""
-    schema_path = os.path.join(
-        os.path.dirname(__file__), "..", "src", "data", "content_schema.json"
-    )
-    with open(schema_path, "r") as f:
-        return json.load(f)
+    with open(_DATA_DIR / "content_schema.json", "rb") as f:
+        return orjson.loads(f.read())
 
 
+@lru_cache(maxsize=1)
 def load_content():
     """Load the existing content.json file."""
-    content_path = os.path.join(
-        os.path.dirname(__file__), "..", "src", "data", "content.json"
-    )
-    with open(content_path, "r") as f:
-        return json.load(f)
+    with open(_DATA_DIR / "content.json", "rb") as f:
+        return orjson.loads(f.read())
+
+
+_VALIDATOR = Draft7Validator(load_schema())
+
+
+def _is_invalid(instance):
+    """Return True as soon as the validator reports a first schema violation."""
+    return next(_VALIDATOR.iter_errors(instance), None) is not None
 
 
 class TestSchemaValidation:
@@ -64,8 +70,6 @@ class TestSchemaValidation:
 
     def test_schema_rejects_invalid_greetings(self):
         """Test that the schema rejects greeting messages without {name} placeholder."""
-        schema = load_schema()
-
         # Invalid content - greeting without {name} placeholder
         invalid_content = {
             "messages": {
@@ -73,18 +77,14 @@ class TestSchemaValidation:
             }
         }
 
-        with pytest.raises(ValidationError):
-            validate(instance=invalid_content, schema=schema)
+        assert _is_invalid(invalid_content)
 
     def test_schema_rejects_empty_greetings(self):
         """Test that the schema rejects empty greetings array."""
-        schema = load_schema()
-
         # Invalid content - empty greetings array
         invalid_content = {"messages": {"greetings": []}}  # Empty array not allowed
 
-        with pytest.raises(ValidationError):
-            validate(instance=invalid_content, schema=schema)
+        assert _is_invalid(invalid_content)
 
     def test_schema_allows_custom_message_categories(self):
         """Test that the schema allows custom message categories."""
@@ -1,9 +1,13 @@
 """Tests for utils content externalization."""
 
-import json
+import mmap
 import os
-import tempfile
-from unittest.mock import patch
+import re
+from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+import pytest
 
 from src.utils import (
     get_default_content_path,
@@ -12,130 +16,237 @@ from src.utils import (
     load_tips_from_json,
 )
 
+_UTILS_PATH = Path(__file__).resolve().parent.parent / "src" / "utils.py"
+
+_REQUIRED_SECTIONS = frozenset({"tips", "messages", "prompts"})
+
+# Content that used to be hardcoded in utils.py, matched in a single pass
+_HARDCODED_PATTERNS = (
+    "default_tips = {",
+    "mcp-test",
+    "Configure this server by adding it to your MCP client",
+    "Set the TIPS_JSON_PATH environment variable",
+    "Use 'uv run src/server.py' to start the server",
+)
+_HARDCODED_RE = re.compile(
+    b"|".join(re.escape(pattern.encode()) for pattern in _HARDCODED_PATTERNS)
+)
+
+# Paths that never exist, for exercising loader fallbacks without touching disk
+_BAD_JSON_PATHS = ("/nonexistent/a.json", "/nonexistent/b.json")
+
+
+@pytest.fixture(scope="module")
+def base_content():
+    """Messages and prompts sections shared by custom content payloads."""
+    return {"messages": {"greetings": ["Hello {name}!"]}, "prompts": {}}
+
+
+@pytest.fixture
+def write_content_file(tmp_path):
+    """Return a helper that writes content to a JSON file under tmp_path."""
+
+    def _write(content):
+        content_file = tmp_path / "content.json"
+        content_file.write_bytes(orjson.dumps(content))
+        return str(content_file)
+
+    return _write
+
+
+@pytest.fixture(scope="session")
+def utils_source():
+    """Map the raw utils.py source read-only for the session."""
+    with open(_UTILS_PATH, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            yield source
+
+
+@pytest.fixture(scope="module")
+def default_content():
+    """Load the default content configuration once per module."""
+    return load_default_content()
+
+
+def _frozen(tips):
+    """Return tips in the read-only shape produced by load_tips_from_json."""
+    return {category: tuple(category_tips) for category, category_tips in tips.items()}
+
+
+def _assert_default_shape(content):
+    """Assert that content has every section plus MCP tips and greetings."""
+    # Should contain all expected sections
+    assert isinstance(content, dict)
+    assert _REQUIRED_SECTIONS.issubset(content)
+    assert {type(content[section]) for section in _REQUIRED_SECTIONS} == {dict}
+
+    # Should have tips for MCP
+    mcp_tips = content["tips"].get("mcp")
+    assert isinstance(mcp_tips, list)
+    assert len(mcp_tips) > 0
+
+    # Should have greeting messages
+    greetings = content["messages"].get("greetings")
+    assert isinstance(greetings, list)
+    assert len(greetings) > 0
+
 
 class TestUtilsExternalization:
     """Test suite for utils content externalization."""
 
     def test_load_content_from_json_default(self):
         """Test loading content from default content.json."""
-        content = load_content_from_json()
+        _assert_default_shape(load_content_from_json())
 
-        # Should contain all expected sections
-        assert isinstance(content, dict)
-        assert "tips" in content
-        assert "messages" in content
-        assert "prompts" in content
+    def test_load_content_from_json_returns_independent_copies(self):
+        """Test that repeated loads return equal content that is safe to mutate."""
+        content = load_content_from_json()
 
-        # Should have tips for MCP
-        tips = content["tips"]
-        assert "mcp" in tips
-        assert isinstance(tips["mcp"], list)
-        assert len(tips["mcp"]) > 0
+        assert load_content_from_json() is not content
+        assert load_default_content() == content
+        assert load_tips_from_json() == _frozen(content["tips"])
+        assert load_tips_from_json() is load_tips_from_json()
 
-        # Should have greeting messages
-        messages = content["messages"]
-        assert "greetings" in messages
-        assert isinstance(messages["greetings"], list)
-        assert len(messages["greetings"]) > 0
+        # Mutating one result must not leak into the cached content
+        content["tips"]["mcp"].append("Injected tip")
+        assert "Injected tip" not in load_content_from_json()["tips"]["mcp"]
 
     def test_load_tips_from_json_uses_content_manager(self):
         """Test that load_tips_from_json extracts tips from full content."""
         tips = load_tips_from_json()
 
-        # Should return tips dictionary
-        assert isinstance(tips, dict)
+        # Should return a read-only tips mapping
+        assert isinstance(tips, MappingProxyType)
         assert "mcp" in tips
         assert "python" in tips
         assert "docker" in tips
 
         # Verify tips content
         mcp_tips = tips["mcp"]
-        assert isinstance(mcp_tips, list)
+        assert isinstance(mcp_tips, tuple)
         assert len(mcp_tips) > 0
-        assert all(isinstance(tip, str) for tip in mcp_tips)
-
-    def test_load_tips_from_json_with_custom_file(self):
-        """Test loading tips from custom JSON file."""
-        # Create custom content
-        custom_content = {
-            "tips": {
-                "custom": ["Custom tip 1", "Custom tip 2"],
-                "testing": ["Test tip"],
-            },
-            "messages": {"greetings": ["Hello {name}!"]},
-            "prompts": {},
-        }
-
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(custom_content, f)
-            temp_file = f.name
-
-        try:
-            tips = load_tips_from_json(temp_file)
-
-            # Should return only the tips section
-            assert tips == custom_content["tips"]
-            assert "custom" in tips
-            assert "testing" in tips
-            assert tips["custom"] == ["Custom tip 1", "Custom tip 2"]
-
-        finally:
-            os.unlink(temp_file)
-
-    def test_load_tips_from_json_with_environment_variable(self):
-        """Test loading tips using TIPS_JSON_PATH environment variable."""
-        # Create custom content
-        custom_content = {
-            "tips": {"env_test": ["Environment test tip"]},
-            "messages": {"greetings": ["Hello {name}!"]},
-            "prompts": {},
-        }
-
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(custom_content, f)
-            temp_file = f.name
-
-        try:
-            # Mock environment variable
-            with patch.dict(os.environ, {"TIPS_JSON_PATH": temp_file}):
-                tips = load_tips_from_json()
-
-                assert "env_test" in tips
-                assert tips["env_test"] == ["Environment test tip"]
-
-        finally:
-            os.unlink(temp_file)
-
-    def test_load_tips_from_json_missing_tips_section(self):
-        """Test loading tips when tips section is missing."""
-        # Content without tips section
-        content_without_tips = {
-            "messages": {"greetings": ["Hello {name}!"]},
-            "prompts": {},
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(content_without_tips, f)
-            temp_file = f.name
-
-        try:
+        assert {type(tip) for tip in mcp_tips} == {str}
+
+    @pytest.mark.filesystem
+    @pytest.mark.parametrize(
+        "overrides, use_env_var",
+        [
+            pytest.param(
+                {
+                    "tips": {
+                        "custom": ["Custom tip 1", "Custom tip 2"],
+                        "testing": ["Test tip"],
+                    }
+                },
+                False,
+                id="custom_file",
+            ),
+            pytest.param(
+                {"tips": {"env_test": ["Environment test tip"]}},
+                True,
+                id="environment_variable",
+            ),
+            pytest.param({}, False, id="missing_tips_section"),
+            pytest.param(
+                {
+                    "tips": {
+                        "legacy": ["Legacy tip 1", "Legacy tip 2"],
+                        "old_format": ["Old format tip"],
+                    }
+                },
+                False,
+                id="backward_compatibility",
+            ),
+            pytest.param(
+                {
+                    "tips": {
+                        "category1": ["Tip 1", "Tip 2"],
+                        "category2": ["Tip 3", "Tip 4"],
+                        "category3": ["Tip 5"],
+                    },
+                    "messages": {
+                        "greetings": ["Hello {name}!"],
+                        "farewells": ["Goodbye!"],
+                    },
+                    "prompts": {
+                        "development": {
+                            "prompt1": {
+                                "name": "prompt1",
+                                "description": "Test prompt",
+                                "template": "Test template",
+                            }
+                        },
+                        "learning": {
+                            "prompt2": {
+                                "name": "prompt2",
+                                "description": "Test prompt 2",
+                                "template": "Test template 2",
+                            }
+                        },
+                    },
+                },
+                False,
+                id="complex_content",
+            ),
+        ],
+    )
+    def test_load_tips_from_custom_content(
+        self, write_content_file, monkeypatch, base_content, overrides, use_env_var
+    ):
+        """Test that only the tips section is extracted from custom content files."""
+        temp_file = write_content_file({**base_content, **overrides})
+
+        if use_env_var:
+            monkeypatch.setenv("TIPS_JSON_PATH", temp_file)
+            tips = load_tips_from_json()
+        else:
             tips = load_tips_from_json(temp_file)
 
-            # Should return empty dictionary
-            assert tips == {}
+        # Missing tips sections fall back to an empty mapping
+        assert tips == _frozen(overrides.get("tips", {}))
 
-        finally:
-            os.unlink(temp_file)
-
-    def test_load_tips_from_json_invalid_file(self):
+    @pytest.mark.parametrize("json_path", _BAD_JSON_PATHS)
+    def test_load_tips_from_json_invalid_file(self, json_path):
         """Test loading tips from invalid file."""
-        tips = load_tips_from_json("/nonexistent/file.json")
+        tips = load_tips_from_json(json_path)
 
         # Should return empty dictionary for invalid file
         assert tips == {}
 
+    def test_load_tips_from_json_is_read_only(self):
+        """Test that loaded tips cannot be changed through the returned mapping."""
+        tips = load_tips_from_json()
+
+        with pytest.raises(TypeError):
+            tips["injected"] = ["Injected tip"]
+        with pytest.raises(AttributeError):
+            tips["mcp"].append("Injected tip")
+        assert "injected" not in load_content_from_json()["tips"]
+
+    def test_load_tips_from_json_fallback_is_shared_and_read_only(self):
+        """Test that every fallback path returns the same read-only empty mapping."""
+        missing, other_missing = map(load_tips_from_json, _BAD_JSON_PATHS)
+
+        assert missing is other_missing
+        with pytest.raises(TypeError):
+            missing["mcp"] = ["Injected tip"]
+
+    @pytest.mark.filesystem
+    def test_load_tips_from_json_cache_invalidated_on_change(self, tmp_path):
+        """Test that cached tips are reloaded when the file changes on disk."""
+        content_file = tmp_path / "content.json"
+        content_file.write_bytes(orjson.dumps({"tips": {"first": ["First tip"]}}))
+
+        first_tips = load_tips_from_json(str(content_file))
+        assert first_tips == {"first": ("First tip",)}
+
+        # Repeated loads of an unchanged file return the cached result
+        assert load_tips_from_json(str(content_file)) is first_tips
+
+        content_file.write_bytes(orjson.dumps({"tips": {"second": ["Second tip"]}}))
+
+        assert load_tips_from_json(str(content_file)) == {"second": ("Second tip",)}
+
     def test_get_default_content_path(self):
         """Test getting default content path."""
         path = get_default_content_path()
@@ -145,110 +256,45 @@ class TestUtilsExternalization:
         assert path.endswith("content.json")
         assert os.path.exists(path)
 
-    def test_load_default_content(self):
+    def test_load_default_content(self, default_content):
         """Test loading default content."""
-        content = load_default_content()
+        _assert_default_shape(default_content)
 
-        # Should contain all expected sections
-        assert isinstance(content, dict)
-        assert "tips" in content
-        assert "messages" in content
-        assert "prompts" in content
+    def test_no_hardcoded_content_in_utils(self, utils_source):
+        """Test that utils.py no longer contains hardcoded content."""
+        # Scan the source once for any of the hardcoded patterns
+        match = _HARDCODED_RE.search(utils_source)
+        assert match is None, f"Found hardcoded content: {match.group().decode()}"
 
-        # Verify content structure
-        assert isinstance(content["tips"], dict)
-        assert isinstance(content["messages"], dict)
-        assert isinstance(content["prompts"], dict)
 
-    def test_no_hardcoded_content_in_utils(self):
-        """Test that utils.py no longer contains hardcoded content."""
-        # Read the utils.py file
-        utils_path = os.path.join(os.path.dirname(__file__), "..", "src", "utils.py")
-        with open(utils_path, "r") as f:
-            utils_content = f.read()
-
-        # Check that hardcoded content is removed
-        hardcoded_patterns = [
-            "default_tips = {",
-            "mcp-test",
-            "Configure this server by adding it to your MCP client",
-            "Set the TIPS_JSON_PATH environment variable",
-            "Use 'uv run src/server.py' to start the server",
-        ]
-
-        for pattern in hardcoded_patterns:
-            assert pattern not in utils_content, f"Found hardcoded content: {pattern}"
-
-    def test_backward_compatibility_preserved(self):
-        """Test that existing JSON file loading still works."""
-        # Create a legacy tips-only JSON file
-        legacy_tips = {
-            "legacy": ["Legacy tip 1", "Legacy tip 2"],
-            "old_format": ["Old format tip"],
-        }
-
-        # Create a modern content file that includes tips
-        modern_content = {
-            "tips": legacy_tips,
-            "messages": {"greetings": ["Hello {name}!"]},
-            "prompts": {},
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(modern_content, f)
-            temp_file = f.name
-
-        try:
-            # Test that tips can still be loaded
-            tips = load_tips_from_json(temp_file)
+@pytest.mark.filesystem
+class TestTipsLoadingFromEnvironment:
+    """Test load_tips_from_json driven by the TIPS_JSON_PATH environment variable."""
 
-            assert tips == legacy_tips
-            assert "legacy" in tips
-            assert "old_format" in tips
-
-        finally:
-            os.unlink(temp_file)
-
-    def test_tips_extraction_from_complex_content(self):
-        """Test tips extraction from complex content structure."""
-        complex_content = {
-            "tips": {
-                "category1": ["Tip 1", "Tip 2"],
-                "category2": ["Tip 3", "Tip 4"],
-                "category3": ["Tip 5"],
-            },
-            "messages": {"greetings": ["Hello {name}!"], "farewells": ["Goodbye!"]},
-            "prompts": {
-                "development": {
-                    "prompt1": {
-                        "name": "prompt1",
-                        "description": "Test prompt",
-                        "template": "Test template",
-                    }
-                },
-                "learning": {
-                    "prompt2": {
-                        "name": "prompt2",
-                        "description": "Test prompt 2",
-                        "template": "Test template 2",
-                    }
-                },
-            },
-        }
+    def test_load_tips_from_env_valid_file(self, tips_json_fixtures, monkeypatch):
+        """Test loading tips from a valid file named by TIPS_JSON_PATH."""
+        monkeypatch.setenv("TIPS_JSON_PATH", str(tips_json_fixtures["valid"]))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(complex_content, f)
-            temp_file = f.name
+        tips = load_tips_from_json()
 
-        try:
-            tips = load_tips_from_json(temp_file)
+        assert tips == {"fixture": ("Fixture tip 1", "Fixture tip 2")}
+
+    def test_load_tips_from_env_invalid_json(self, tips_json_fixtures, monkeypatch):
+        """Test that malformed JSON falls back to empty tips."""
+        monkeypatch.setenv("TIPS_JSON_PATH", str(tips_json_fixtures["invalid"]))
+
+        assert load_tips_from_json() == {}
+
+    def test_load_tips_from_env_wrong_data_type(self, tips_json_fixtures, monkeypatch):
+        """Test that content failing schema validation falls back to empty tips."""
+        monkeypatch.setenv("TIPS_JSON_PATH", str(tips_json_fixtures["wrongtype"]))
+
+        assert load_tips_from_json() == {}
+
+    def test_explicit_path_takes_precedence(self, tips_json_fixtures, monkeypatch):
+        """Test that an explicit path overrides TIPS_JSON_PATH."""
+        monkeypatch.setenv("TIPS_JSON_PATH", str(tips_json_fixtures["invalid"]))
 
-            # Should extract only tips section
-            assert tips == complex_content["tips"]
-            assert len(tips) == 3
-            assert "category1" in tips
-            assert "category2" in tips
-            assert "category3" in tips
+        tips = load_tips_from_json(str(tips_json_fixtures["valid"]))
 
-        finally:
-            os.unlink(temp_file)
+        assert "fixture" in tips